@@ -37,7 +37,14 @@ async def market(
     extra_params: ExtraParams,
 ) -> OBBject:
     """Historical Market Indices."""
-    return await OBBject.from_query(Query(**locals()))
+    return await OBBject.from_query(
+        Query(
+            cc=cc,
+            provider_choices=provider_choices,
+            standard_params=standard_params,
+            extra_params=extra_params,
+        )
+    )
 
 
 @router.command(
@@ -57,7 +64,14 @@ async def constituents(
     extra_params: ExtraParams,
 ) -> OBBject:
     """Index Constituents."""
-    return await OBBject.from_query(Query(**locals()))
+    return await OBBject.from_query(
+        Query(
+            cc=cc,
+            provider_choices=provider_choices,
+            standard_params=standard_params,
+            extra_params=extra_params,
+        )
+    )
 
 
 @router.command(
@@ -74,7 +88,14 @@ async def snapshots(
     extra_params: ExtraParams,
 ) -> OBBject:
     """Index Snapshots. Current levels for all indices from a provider, grouped by `region`."""
-    return await OBBject.from_query(Query(**locals()))
+    return await OBBject.from_query(
+        Query(
+            cc=cc,
+            provider_choices=provider_choices,
+            standard_params=standard_params,
+            extra_params=extra_params,
+        )
+    )
 
 
 @router.command(
@@ -91,7 +112,14 @@ async def available(
     extra_params: ExtraParams,
 ) -> OBBject:
     """All indices available from a given provider."""
-    return await OBBject.from_query(Query(**locals()))
+    return await OBBject.from_query(
+        Query(
+            cc=cc,
+            provider_choices=provider_choices,
+            standard_params=standard_params,
+            extra_params=extra_params,
+        )
+    )
 
 
 @router.command(
@@ -108,7 +136,14 @@ async def search(
     extra_params: ExtraParams,
 ) -> OBBject:
     """Filters indices for rows containing the query."""
-    return await OBBject.from_query(Query(**locals()))
+    return await OBBject.from_query(
+        Query(
+            cc=cc,
+            provider_choices=provider_choices,
+            standard_params=standard_params,
+            extra_params=extra_params,
+        )
+    )
 
 
 @router.command(
@@ -125,7 +160,14 @@ async def sp500_multiples(
     extra_params: ExtraParams,
 ) -> OBBject:
     """Historical S&P 500 multiples and Shiller PE ratios."""
-    return await OBBject.from_query(Query(**locals()))
+    return await OBBject.from_query(
+        Query(
+            cc=cc,
+            provider_choices=provider_choices,
+            standard_params=standard_params,
+            extra_params=extra_params,
+        )
+    )
 
 
 @router.command(
@@ -139,4 +181,11 @@ async def sectors(
     extra_params: ExtraParams,
 ) -> OBBject:
     """Index Sectors. Sector weighting of an index."""
-    return await OBBject.from_query(Query(**locals()))
+    return await OBBject.from_query(
+        Query(
+            cc=cc,
+            provider_choices=provider_choices,
+            standard_params=standard_params,
+            extra_params=extra_params,
+        )
+    )
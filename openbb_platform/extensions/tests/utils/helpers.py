@@ -2,15 +2,17 @@
 
 import ast
 import doctest
-import glob
 import importlib
 import inspect
 import logging
 import os
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from importlib.metadata import entry_points
-from inspect import getmembers, isfunction
-from typing import Any, Dict, List, Set, Tuple
+from types import FunctionType, ModuleType
+from typing import Any, Dict, FrozenSet, Iterator, List, Tuple
 
 from openbb_core.app.provider_interface import ProviderInterface
 
@@ -18,19 +20,32 @@ pi = ProviderInterface()
 
 logging.basicConfig(level=logging.INFO)
 
+_ROUTER_CACHE: Dict[str, ModuleType] = {}
+
+# Regular expression patterns to find PythonEx and APIEx examples
+_PYTHONEX_RE = re.compile(r"PythonEx\(.*?code=(\[.*?\]).*?\)", re.DOTALL)
+_APIEX_RE = re.compile(r"APIEx\(.*?parameters=(\{.*?\}).*?\)", re.DOTALL)
+
+
+@lru_cache(maxsize=None)
+def _packages_info(package_dir: str) -> Tuple[Tuple[str, str], ...]:
+    """Collect the paths and names of the static packages in an absolute directory."""
+    if not os.path.isdir(package_dir):
+        return ()
+
+    with os.scandir(package_dir) as entries:
+        return tuple(
+            (entry.path, entry.name.split(".")[0])
+            for entry in entries
+            if entry.name.endswith(".py") and not entry.name.startswith("_")
+        )
+
 
 def get_packages_info() -> Dict[str, str]:
     """Get the paths and names of all the static packages."""
-    paths_and_names: Dict[str, str] = {}
-    package_paths = glob.glob("openbb_platform/openbb/package/*.py")
-    for path in package_paths:
-        name = os.path.basename(path).split(".")[0]
-        paths_and_names[path] = name
-
-    paths_and_names = {
-        path: name for path, name in paths_and_names.items() if not name.startswith("_")
-    }
-    return paths_and_names
+    _, package_dir = _platform_paths("openbb/package")
+
+    return dict(_packages_info(package_dir))
 
 
 def execute_docstring_examples(module_name: str, path: str) -> List[str]:
@@ -40,9 +55,11 @@ def execute_docstring_examples(module_name: str, path: str) -> List[str]:
     doc_tests = doctest.DocTestFinder().find(module)
 
     for dt in doc_tests:
-        code = "".join([ex.source for ex in dt.examples])
+        code = "".join(ex.source for ex in dt.examples)
         try:
-            exec(code)  # pylint: disable=exec-used  # noqa: S102
+            exec(  # pylint: disable=exec-used  # noqa: S102
+                compile(code, path, "exec"), {"__name__": "__doctest__"}
+            )
         except Exception as e:
             errors.append(
                 f"\n\n{'_'*136}\nPath: {path}\nCode:\n{code}\nError: {str(e)}"
@@ -51,75 +68,125 @@ def execute_docstring_examples(module_name: str, path: str) -> List[str]:
     return errors
 
 
+def _run_one(path_and_name: Tuple[str, str]) -> List[str]:
+    """Execute the docstring examples of a single package."""
+    path, name = path_and_name
+    return execute_docstring_examples(name, path)
+
+
 def check_docstring_examples() -> List[str]:
     """Test that the docstring examples execute without errors."""
     errors = []
+    # Importing openbb auto-builds the static package, do it once here so the
+    # workers don't rebuild the package tree concurrently while importing from it
+    importlib.import_module("openbb")
     paths_and_names = get_packages_info()
 
-    for path, name in paths_and_names.items():
-        result = execute_docstring_examples(name, path)
-        if result:
+    # Each package is independent, so they are executed in separate processes
+    with ProcessPoolExecutor() as executor:
+        for result in executor.map(_run_one, paths_and_names.items(), chunksize=4):
             errors.extend(result)
 
     return errors
 
 
-def list_openbb_extensions() -> Tuple[Set[str], Set[str], Set[str]]:
+@lru_cache(maxsize=1)
+def _load_entry_points() -> Any:
+    """Load the installed entry points, parsing the package metadata only once."""
+    return entry_points()
+
+
+def _entry_point_names(group: str) -> FrozenSet[str]:
+    """Get the names of the entry points registered under a group."""
+    eps = _load_entry_points()
+    try:
+        selected = eps.select(group=group)
+    except AttributeError:
+        # Python < 3.10 returns a plain dict of groups
+        selected = eps.get(group, [])
+    return frozenset(entry_point.name for entry_point in selected)
+
+
+def list_openbb_extensions() -> Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]:
     """List installed openbb extensions and providers.
 
     Returns
     -------
-    Tuple[Set[str], Set[str]]
+    Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]
         First element: set of installed core extensions.
         Second element: set of installed provider extensions.
         Third element: set of installed obbject extensions.
     """
+    core_extensions = _entry_point_names("openbb_core_extension")
+    provider_extensions = _entry_point_names("openbb_provider_extension")
+    obbject_extensions = _entry_point_names("openbb_obbject_extension")
 
-    core_extensions = set()
-    provider_extensions = set()
-    obbject_extensions = set()
-    entry_points_dict = entry_points()
+    return core_extensions, provider_extensions, obbject_extensions
 
-    for entry_point in entry_points_dict.get("openbb_core_extension", []):
-        core_extensions.add(f"{entry_point.name}")
 
-    for entry_point in entry_points_dict.get("openbb_provider_extension", []):
-        provider_extensions.add(f"{entry_point.name}")
+def _platform_paths(target_dir: str) -> Tuple[str, str]:
+    """Resolve the platform base path and the absolute target directory."""
+    current_dir = os.path.dirname(__file__)
+    base_path = os.path.realpath(os.path.join(current_dir, "../../../"))
 
-    for entry_point in entry_points_dict.get("openbb_obbject_extension", []):
-        obbject_extensions.add(f"{entry_point.name}")
+    full_target_path = os.path.realpath(os.path.join(base_path, target_dir))
+
+    return base_path, full_target_path
+
+
+def _walk_routers(root: str) -> Iterator[str]:
+    """Yield the path of every router file under root, scanning each directory once."""
+    pending = deque([root])
+    while pending:
+        with os.scandir(pending.popleft()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith("_router.py") and entry.is_file():
+                    yield entry.path
 
-    return core_extensions, provider_extensions, obbject_extensions
+
+def iter_routers(target_dir: str) -> Iterator[str]:
+    """Yield the module path of each router in the target directory as it is found."""
+    base_path, full_target_path = _platform_paths(target_dir)
+
+    for full_path in _walk_routers(full_target_path):
+        # Convert the full path to a module path
+        relative_path = os.path.relpath(full_path, base_path)
+        yield relative_path.replace("/", ".").replace(".py", "")
+
+
+@lru_cache(maxsize=None)
+def _collect_routers(full_target_path: str) -> Tuple[str, ...]:
+    """Collect the module paths of all routers under an absolute directory."""
+    return tuple(iter_routers(full_target_path))
 
 
 def collect_routers(target_dir: str) -> List[str]:
     """Collect all routers in the target directory."""
-    current_dir = os.path.dirname(__file__)
-    base_path = os.path.abspath(os.path.join(current_dir, "../../../"))
+    _, full_target_path = _platform_paths(target_dir)
+
+    return list(_collect_routers(full_target_path))
 
-    full_target_path = os.path.abspath(os.path.join(base_path, target_dir))
-    routers = []
 
-    for root, _, files in os.walk(full_target_path):
-        for name in files:
-            if name.endswith("_router.py"):
-                full_path = os.path.join(root, name)
-                # Convert the full path to a module path
-                relative_path = os.path.relpath(full_path, base_path)
-                module_path = relative_path.replace("/", ".").replace(".py", "")
-                routers.append(module_path)
+def _import_router(router: str) -> ModuleType:
+    """Import a router module, reusing it if it was already imported."""
+    module = _ROUTER_CACHE.get(router)
+    if module is None:
+        module = importlib.import_module(router)
+        _ROUTER_CACHE[router] = module
+    return module
+
 
-    return routers
+def iter_imported_routers(target_dir: str) -> Iterator[ModuleType]:
+    """Yield each router module in the target directory, importing it lazily."""
+    for router in iter_routers(target_dir):
+        yield _import_router(router)
 
 
 def import_routers(routers: List) -> List:
     """Import all routers."""
-    loaded_routers: List = []
-    for router in routers:
-        module = importlib.import_module(router)
-        loaded_routers.append(module)
-
-    return loaded_routers
+    return [_import_router(router) for router in routers]
 
 
 def collect_router_functions(loaded_routers: List) -> Dict:
@@ -127,14 +194,36 @@ def collect_router_functions(loaded_routers: List) -> Dict:
     router_functions = {}
     for router in loaded_routers:
         router_functions[router.__name__] = [
-            function[1]
-            for function in getmembers(router, isfunction)
-            if function[0] != "router"
+            obj
+            for name, obj in router.__dict__.items()
+            if name != "router" and isinstance(obj, FunctionType)
         ]
 
     return router_functions
 
 
+@lru_cache(maxsize=None)
+def _decorators_for_file(file_path: str) -> Dict[str, str]:
+    """Map each function in the file to the source of its @router.command decorator."""
+    with open(file_path) as file:
+        source = file.read()
+
+    decorators: Dict[str, str] = {}
+    for node in ast.walk(ast.parse(source)):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for decorator in node.decorator_list:
+            func = decorator.func if isinstance(decorator, ast.Call) else decorator
+            if isinstance(func, ast.Attribute) and func.attr == "command":
+                segment = ast.get_source_segment(source, decorator) or ""
+                # Flatten multiline decorators into a single line
+                decorators[node.name] = "@" + " ".join(
+                    line.strip() for line in segment.splitlines()
+                )
+
+    return decorators
+
+
 def find_decorator(file_path: str, function_name: str) -> str:
     """Find the @router.command decorator of the function in the file, supporting multiline decorators."""
     this_dir = os.path.dirname(os.path.abspath(__file__))
@@ -142,67 +231,74 @@ def find_decorator(file_path: str, function_name: str) -> str:
         this_dir.split("openbb_platform/")[0], "openbb_platform", file_path
     )
 
-    with open(file_path) as file:
-        lines = file.readlines()
-
-    decorator_lines = []
-    capturing_decorator = False
-    for line in lines:
-        stripped_line = line.strip()
-        # Start capturing lines if we encounter a decorator
-        if stripped_line.startswith("@router.command"):
-            capturing_decorator = True
-            decorator_lines.append(stripped_line)
-        elif capturing_decorator:
-            # If we're currently capturing a decorator and the line is part of it (indentation or open parenthesis)
-            if (
-                stripped_line.startswith("@")
-                or "def" in stripped_line
-                and function_name in stripped_line
-            ):
-                # If we've reached another decorator or the function definition, stop capturing
-                capturing_decorator = False
-                # If it's the target function, break, else clear decorator_lines for the next decorator
-                if "def" in stripped_line and function_name in stripped_line:
-                    break
-                decorator_lines = []
-            else:
-                # It's part of the multiline decorator
-                decorator_lines.append(stripped_line)
+    return _decorators_for_file(file_path).get(function_name, "")
+
+
+def _decorator_detail(decorator: ast.expr) -> Dict[str, Any]:
+    """Extract the name and arguments of a decorator as a dictionary."""
+    decorator_detail: Dict[str, Any] = {"decorator": "", "args": {}, "keywords": {}}
+    if isinstance(decorator, ast.Call):
+        decorator_detail["decorator"] = (
+            decorator.func.id
+            if isinstance(decorator.func, ast.Name)
+            else ast.unparse(decorator.func)
+        )
+        decorator_detail["args"] = {
+            i: ast.unparse(arg) for i, arg in enumerate(decorator.args)
+        }
+        decorator_detail["keywords"] = {
+            kw.arg: ast.unparse(kw.value) for kw in decorator.keywords
+        }
+    else:
+        decorator_detail["decorator"] = (
+            decorator.id if isinstance(decorator, ast.Name) else ast.unparse(decorator)
+        )
+
+    return decorator_detail
+
+
+@lru_cache(maxsize=None)
+def _module_decorator_map(module_file: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Map the qualified name of each function in the module to its decorator details."""
+    with open(module_file) as file:
+        tree = ast.parse(file.read())
+
+    decorator_map: Dict[str, List[Dict[str, Any]]] = {}
+    # Qualified name prefix of each node, filled in as its parent is visited
+    prefixes: Dict[ast.AST, str] = {}
+    for node in ast.walk(tree):
+        prefix = prefixes.get(node, "")
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            qualname = prefix + node.name
+            decorator_map[qualname] = [
+                _decorator_detail(decorator) for decorator in node.decorator_list
+            ]
+            prefix = f"{qualname}.<locals>."
+        elif isinstance(node, ast.ClassDef):
+            prefix = f"{prefix}{node.name}."
+        for child in ast.iter_child_nodes(node):
+            prefixes[child] = prefix
 
-    decorator = " ".join(decorator_lines)
-    return decorator
+    return decorator_map
 
 
 def get_decorator_details(function):
     """Extract decorators and their arguments from a function as dictionaries."""
-    source = inspect.getsource(function)
-    parsed_source = ast.parse(source)
-
-    if isinstance(parsed_source.body[0], (ast.FunctionDef, ast.AsyncFunctionDef)):
-        func_def = parsed_source.body[0]
-        for decorator in func_def.decorator_list:
-            decorator_detail = {"decorator": "", "args": {}, "keywords": {}}
-            if isinstance(decorator, ast.Call):
-                decorator_detail["decorator"] = (
-                    decorator.func.id
-                    if isinstance(decorator.func, ast.Name)
-                    else ast.unparse(decorator.func)
-                )
-                decorator_detail["args"] = {
-                    i: ast.unparse(arg) for i, arg in enumerate(decorator.args)
-                }
-                decorator_detail["keywords"] = {
-                    kw.arg: ast.unparse(kw.value) for kw in decorator.keywords
-                }
-            else:
-                decorator_detail["decorator"] = (
-                    decorator.id
-                    if isinstance(decorator, ast.Name)
-                    else ast.unparse(decorator)
-                )
+    function = inspect.unwrap(function)
+    module_file = inspect.getsourcefile(function)
+    details = (
+        _module_decorator_map(module_file).get(function.__qualname__)
+        if module_file
+        else None
+    )
 
-    return decorator_detail
+    if not details:
+        return {"decorator": "", "args": {}, "keywords": {}}
+    # Prefer the router command over any other decorator on the function
+    return next(
+        (detail for detail in details if detail["decorator"] == "router.command"),
+        details[-1],
+    )
 
 
 def find_missing_router_function_models(
@@ -213,7 +309,7 @@ def find_missing_router_function_models(
     for router_name, functions in router_functions.items():
         for function in functions:
             decorator = find_decorator(
-                os.path.join(*router_name.split(".")) + ".py",
+                router_name.replace(".", os.sep) + ".py",
                 function.__name__,
             )
             if (
@@ -240,34 +336,19 @@ def parse_example_string(example_string: str) -> Dict[str, Any]:
 
     This is capturing all instances of PythonEx and APIEx, including their "parameters", "code", and "description".
     """
-    # Initialize the result dictionary
-    result = {}
-
-    # Regular expression patterns to find PythonEx and APIEx examples
-    pythonex_pattern = r"PythonEx\(.*?code=(\[.*?\]).*?\)"
-    apiex_pattern = r"APIEx\(.*?parameters=(\{.*?\}).*?\)"
-
-    # Function to parse individual examples
-    def parse_examples(matches, example_type):
-        examples = []
-        for match in matches:
-            examples.append(
-                {"code": [match]} if example_type == "PythonEx" else {"params": match}
-            )
-        return examples
-
     # Find and parse all PythonEx examples
-    pythonex_matches = re.findall(pythonex_pattern, example_string, re.DOTALL)
-    result["PythonEx"] = parse_examples(pythonex_matches, "PythonEx")
-
+    pythonex_matches = _PYTHONEX_RE.findall(example_string)
     # Find and parse all APIEx examples
-    apiex_matches = re.findall(apiex_pattern, example_string, re.DOTALL)
-    result["APIEx"] = parse_examples(apiex_matches, "APIEx")
+    apiex_matches = _APIEX_RE.findall(example_string)
 
-    return result
+    return {
+        "PythonEx": [{"code": [match]} for match in pythonex_matches],
+        "APIEx": [{"params": match} for match in apiex_matches],
+    }
 
 
-def get_required_fields(model: str) -> List[str]:
+@lru_cache(maxsize=None)
+def get_required_fields(model: str) -> Tuple[str, ...]:
     """Get the required fields of a model."""
     fields = pi.map[model]["openbb"]["QueryParams"]["fields"]
-    return [field for field, info in fields.items() if info.is_required()]
+    return tuple(field for field, info in fields.items() if info.is_required())
@@ -44,7 +44,7 @@ def check_router_model_functions_signature() -> List[str]:
     for router_name, functions in router_functions.items():
         for function in functions:
             decorator = find_decorator(
-                os.path.join(*router_name.split(".")) + ".py",
+                router_name.replace(".", os.sep) + ".py",
                 function.__name__,
             )
             if decorator:
@@ -119,7 +119,7 @@ def check_router_command_examples() -> List[str]:
             ):
                 continue
             decorator = find_decorator(
-                os.path.join(*router_name.split(".")) + ".py",
+                router_name.replace(".", os.sep) + ".py",
                 function.__name__,
             )
             if decorator:
@@ -2,12 +2,14 @@
 
 # pylint: disable=unused-argument
 
+import json
 from datetime import (
     date as dateType,
     datetime,
     time,
     timezone,
 )
+from functools import lru_cache
 from typing import Any, Dict, List, Literal, Optional, Union
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -18,7 +20,7 @@ from openbb_core.provider.standard_models.price_target import (
 from openbb_core.provider.utils.descriptions import QUERY_DESCRIPTIONS
 from openbb_core.provider.utils.errors import EmptyDataError
 from openbb_core.provider.utils.helpers import amake_requests, get_querystring
-from pydantic import Field, field_validator, model_validator
+from pydantic import Field, TypeAdapter, field_validator, model_validator
 from pytz import UTC
 
 COVERAGE_DICT = {
@@ -144,11 +146,22 @@ class BenzingaPriceTargetQueryParams(PriceTargetQueryParams):
     @classmethod
     def convert_list(cls, v: Union[str, List[str]]):
         """Convert a List[str] to a string list."""
-        if isinstance(v, str):
+        if v is None or v == "":
+            return None
+        if type(v) is str:  # pylint: disable=unidiomatic-typecheck
             return v
         return ",".join(v) if v else None
 
 
+@lru_cache(maxsize=256)
+def _qs_cache(payload_json: str) -> str:
+    """Build the querystring for a JSON-serialized query, reusing it for identical queries."""
+    # model_dump_json bypasses the __alias_dict__ renaming done by QueryParams.model_dump
+    aliases = BenzingaPriceTargetQueryParams.__alias_dict__
+    items = {aliases.get(k, k): v for k, v in json.loads(payload_json).items()}
+    return get_querystring(items, [])
+
+
 class BenzingaPriceTargetData(PriceTargetData):
     """Benzinga Price Target Data."""
 
@@ -235,9 +248,14 @@ class BenzingaPriceTargetData(PriceTargetData):
     @classmethod
     def replace_empty_strings(cls, values):
         """Check for empty strings and replace with None."""
+        if not any(v == "" for v in values.values()):
+            return values
         return {k: None if v == "" else v for k, v in values.items()}
 
 
+_BENZINGA_ADAPTER = TypeAdapter(List[BenzingaPriceTargetData])
+
+
 class BenzingaPriceTargetFetcher(
     Fetcher[
         BenzingaPriceTargetQueryParams,
@@ -261,7 +279,7 @@ class BenzingaPriceTargetFetcher(
         token = credentials.get("benzinga_api_key") if credentials else ""
 
         base_url = "https://api.benzinga.com/api/v2.1/calendar/ratings"
-        querystring = get_querystring(query.model_dump(by_alias=True), [])
+        querystring = _qs_cache(query.model_dump_json(by_alias=True))
 
         url = f"{base_url}?{querystring}&token={token}"
         data = await amake_requests(url, **kwargs)
@@ -278,9 +296,7 @@ class BenzingaPriceTargetFetcher(
         **kwargs: Any,
     ) -> List[BenzingaPriceTargetData]:
         """Return the transformed data."""
-        results: List[BenzingaPriceTargetData] = []
         # Remove duplicated field with a URL
         for item in data:
             item.pop("url_calendar", None)
-            results.append(BenzingaPriceTargetData.model_validate(item))
-        return results
+        return _BENZINGA_ADAPTER.validate_python(data)
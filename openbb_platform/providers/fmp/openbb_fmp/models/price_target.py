@@ -11,7 +11,7 @@ from openbb_core.provider.standard_models.price_target import (
     PriceTargetQueryParams,
 )
 from openbb_fmp.utils.helpers import create_url, get_data_urls
-from pydantic import Field, field_validator
+from pydantic import Field, TypeAdapter, field_validator, model_validator
 
 
 class FMPPriceTargetQueryParams(PriceTargetQueryParams):
@@ -30,7 +30,7 @@ class FMPPriceTargetData(PriceTargetData):
     """FMP Price Target Data."""
 
     __alias_dict__ = {
-        "analyst_firm": "gradingCompany",
+        "analyst_firm": "analystCompany",
         "rating_current": "newGrade",
         "rating_previous": "previousGrade",
         "news_title": "newsTitle",
@@ -54,8 +54,29 @@ class FMPPriceTargetData(PriceTargetData):
     @field_validator("published_date", mode="before", check_fields=False)
     def validate_date(cls, v: str):  # pylint: disable=E0213
         """Validate the published date."""
-        v = v.replace("\n", "")
-        return datetime.strptime(v, "%Y-%m-%dT%H:%M:%S.%fZ")  # type: ignore
+        v = v.strip()
+        # The trailing "Z" is dropped to keep the naive datetime strptime returned
+        if v.endswith("Z"):
+            v = v[:-1]
+        try:
+            return datetime.fromisoformat(v)
+        except ValueError:
+            return datetime.strptime(v, "%Y-%m-%dT%H:%M:%S.%f")
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_analyst_firm(cls, values):
+        """Use the grading company as the analyst firm for the upgrades-downgrades endpoint."""
+        if (
+            isinstance(values, dict)
+            and "analystCompany" not in values
+            and "gradingCompany" in values
+        ):
+            values["analystCompany"] = values.pop("gradingCompany")
+        return values
+
+
+_FMP_ADAPTER = TypeAdapter(List[FMPPriceTargetData])
 
 
 class FMPPriceTargetFetcher(
@@ -81,10 +102,18 @@ class FMPPriceTargetFetcher(
         api_key = credentials.get("fmp_api_key") if credentials else ""
         endpoint = "upgrades-downgrades" if query.with_grade else "price-target"
 
-        urls = []
-        for symbol in query.symbol.split(","):
-            query.symbol = symbol
-            urls.append(create_url(4, endpoint, api_key, query, exclude=["limit"]))
+        # Dump the query once and swap in each symbol instead of mutating the model
+        base_query = query.model_dump()
+        urls = [
+            create_url(
+                4,
+                endpoint,
+                api_key,
+                {**base_query, "symbol": symbol},
+                exclude=["limit"],
+            )
+            for symbol in query.symbol.split(",")
+        ]
 
         return await get_data_urls(urls)
 
@@ -93,11 +122,4 @@ class FMPPriceTargetFetcher(
         query: FMPPriceTargetQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[FMPPriceTargetData]:
         """Return the transformed data."""
-        results: List[FMPPriceTargetData] = []
-        for item in data:
-            new_item = {
-                k if k != "analystCompany" else "analyst_firm": v
-                for k, v in item.items()
-            }
-            results.append(FMPPriceTargetData.model_validate(new_item))
-        return results
+        return _FMP_ADAPTER.validate_python(data)